@@ -0,0 +1,155 @@
+"""Consistency check for the streaming reader behind ``extract --stream``.
+
+Parses every bundled example plus a few edge-case documents with
+``iter_graph_file`` at several chunk sizes, including 1 byte, so that every
+token boundary is hit. The result must match ``json.load``. Exits 1 on any mismatch.
+
+    python bench/check_stream_reader.py
+"""
+import glob, json, os, sys, tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lib.extract as extract  # noqa: E402
+
+CHUNK_SIZES = (1, 3, 7, 64, 1 << 20)
+
+# Raw text, not json.dumps output, so whitespace and literal placement vary.
+EDGE_CASES = {
+    "numbers_and_literals.json": '{"metadata":{"n":12345678901234567890,"f":-1.5e-7,"t":true,"z":null},'
+                                 '"graph":{"nodes":[{"id":"1","x":0}],"edges":[]},"tail":42}',
+    "whitespace.json": ' \n{ "graph" :\t{ "nodes" : [ ] , "edges" :[\r\n] } , "metadata" : { } }\n',
+    "unicode_escapes.json": '{"graph":{"nodes":[{"id":"\\u00e9\\"q\\\\","kinds":["Déception"]}],'
+                            '"edges":[{"kind":"K","start":{"value":"\\u00e9\\"q\\\\"},"end":{"value":"x"}}]}}',
+    "graph_extras.json": '{"graph":{"version":3,"edges":[{"kind":"K","start":{"value":"a"},"end":{"value":"b"}}],'
+                         '"nodes":[{"id":"a"},{"id":"b"}],"meta":[1,[2,{"3":4}]]}}',
+    "graph_not_object.json": '{"graph":[1,2,3],"metadata":{}}',
+    "empty_object.json": "{}",
+    "top_level_scalars.json": '{"a":1.25e+3,"graph":{"v":-0.5,"nodes":[],"edges":[]},"b":true,"c":12345,"d":"\\u00e9"}',
+}
+
+# name -> (text, True if it is valid JSON that is simply not an object)
+RAISES = {
+    "top_level_list.json": (" [1, 2]", True),
+    "top_level_string.json": ('"graph"', True),
+    "garbage.json": ("garbage", False),
+    "truncated_list.json": ("[1,", False),
+    "list_extra_data.json": ("[1] x", False),
+    "object_extra_data.json": ('{"graph":{}} x', False),
+    "corrupt_node.json": ('{"graph":{"nodes":[{"id":"a"},{"id" "b"},{"id":"c"}],"edges":[]}}', False),
+    "truncated_node.json": ('{"graph":{"nodes":[{"id":"a"},{"id":"b', False),
+}
+
+def rebuild(items):
+    out, graph, nodes, edges = {}, {}, [], []
+    for section, obj in items:
+        if section == "top":
+            out[obj[0]] = obj[1]
+        elif section == "graph":
+            graph[obj[0]] = obj[1]
+        elif section == "node":
+            nodes.append(obj)
+        elif section == "edge":
+            edges.append(obj)
+    graph["nodes"], graph["edges"] = nodes, edges
+    # a non-object "graph" arrives as a top-level item and is kept as-is
+    out.setdefault("graph", graph)
+    return out
+
+def expected(path):
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    g = doc.setdefault("graph", {})
+    if isinstance(g, dict):
+        g.setdefault("nodes", [])
+        g.setdefault("edges", [])
+    return doc
+
+def check(path) -> bool:
+    want = expected(path)
+    ok = True
+    for size in CHUNK_SIZES:
+        extract._CHUNK = size
+        try:
+            got = rebuild(extract.iter_graph_file(path))
+        except ValueError as e:
+            sys.stdout.write(f"FAIL  {os.path.basename(path)} (chunk {size}): {e}\n")
+            ok = False
+            continue
+        if got != want:
+            sys.stdout.write(f"FAIL  {os.path.basename(path)} (chunk {size})\n")
+            ok = False
+    return ok
+
+def check_raises(path, not_a_graph: bool) -> bool:
+    # valid non-object JSON must raise NotAGraphError; corrupt JSON must raise a plain ValueError
+    for size in CHUNK_SIZES:
+        extract._CHUNK = size
+        try:
+            list(extract.iter_graph_file(path))
+        except extract.NotAGraphError:
+            if not_a_graph:
+                continue
+        except ValueError:
+            if not not_a_graph:
+                continue
+        want = "NotAGraphError" if not_a_graph else "ValueError (not NotAGraphError)"
+        sys.stdout.write(f"FAIL  {os.path.basename(path)} (chunk {size}) did not raise {want}\n")
+        return False
+    return True
+
+def check_error_offset() -> bool:
+    # A corrupt node near the start must fail there (not after buffering the rest of the
+    # file), and the reported offset must be relative to the file, not the buffer.
+    head = '{"graph":{"nodes":[' + ",".join('{"id":"n%d"}' % i for i in range(50))
+    bad_at = len(head) + len(',{"id" ')
+    text = head + ',{"id" "bad"}' + "".join(',{"id":"m%d","pad":"%s"}' % (i, "x" * 100) for i in range(5000)) + '],"edges":[]}}'
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "corrupt_early.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        for size in CHUNK_SIZES[:-1]:
+            extract._CHUNK = size
+            with open(path, "r", encoding="utf-8") as f:
+                r = extract._StreamReader(f)
+                try:
+                    for key in r.members():
+                        for gkey in r.members():
+                            list(r.elements())
+                except extract.NotAGraphError:
+                    pass
+                except ValueError as e:
+                    read = r.offset + len(r.buf)
+                    if not str(e).endswith(f"at offset {bad_at}") or read > bad_at + 2 * size + 16:
+                        sys.stdout.write(f"FAIL  corrupt_early.json (chunk {size}): '{e}' after reading {read} chars\n")
+                        return False
+                    continue
+            sys.stdout.write(f"FAIL  corrupt_early.json (chunk {size}) did not raise\n")
+            return False
+    return True
+
+def main() -> int:
+    paths = sorted(glob.glob(os.path.join(ROOT, "examples", "**", "*.json"), recursive=True))
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in EDGE_CASES.items():
+            p = os.path.join(tmp, name)
+            with open(p, "w", encoding="utf-8") as f:
+                f.write(text)
+            paths.append(p)
+        results = [check(p) for p in paths]
+
+        for name, (text, not_a_graph) in RAISES.items():
+            p = os.path.join(tmp, name)
+            with open(p, "w", encoding="utf-8") as f:
+                f.write(text)
+            results.append(check_raises(p, not_a_graph))
+
+    results.append(check_error_offset())
+
+    sys.stdout.write(f"{sum(results)}/{len(results)} documents ok across chunk sizes {CHUNK_SIZES}\n")
+    return 0 if all(results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Startup budget check for commands that never touch the network.
+
+Runs each command under ``python -X importtime`` and fails (exit 1) if the summed
+import time of the fastest run exceeds the budget, or if a command imports a
+module it should only load lazily (requests for register-icon, the process pool
+for --in-dir batches). Modules that ``python -c pass`` already imports (site,
+.pth hooks) are interpreter startup and are not counted.
+
+    python bench/startup_budget.py [--budget-ms 40] [--runs 5]
+"""
+import argparse, os, subprocess, sys, tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "deceptionClone.py")
+EXAMPLE = os.path.join(ROOT, "examples", "deception", "example_data.json")
+MERGE_1 = os.path.join(ROOT, "examples", "gluing", "github_graph.json")
+MERGE_2 = os.path.join(ROOT, "examples", "gluing", "ansible_graph.json")
+
+FORBIDDEN = ("requests", "urllib3", "concurrent.futures", "multiprocessing")
+
+def commands(tmp: str):
+    out = os.path.join(tmp, "out.json")
+    template = os.path.join(tmp, "template.json")
+    with open(template, "w", encoding="utf-8") as f:
+        f.write('{"nodes": [{"ref": "user", "id": "honey-${login}", "kinds": ["Person"], '
+                '"properties": {"name": "${login}"}}], '
+                '"edges": [{"kind": "Knows", "start": "${friend}", "end": "@user"}]}')
+    rows = os.path.join(tmp, "rows.csv")
+    with open(rows, "w", encoding="utf-8") as f:
+        f.write("login,friend\nmallory,234\neve,123\n")
+    return {
+        "--help": ["--help"],
+        "decept-edge": ["--in", EXAMPLE, "--out", out, "decept-edge",
+                        "--edge-kind", "Has", "--start", "234", "--end", "567"],
+        "attach-deception": ["--in", EXAMPLE, "--out", out, "attach-deception", "--id", "234", "--name", "Zipline"],
+        "extract": ["--in", EXAMPLE, "--out", out, "extract", "--hops", "1"],
+        "generate": ["--in", EXAMPLE, "--out", out, "generate", "--template", template, "--csv", rows],
+        "merge-graphs": ["merge-graphs", "--graph1", MERGE_1, "--graph2", MERGE_2, "--out", out],
+    }
+
+def import_profile(argv, skip=frozenset()):
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + argv,
+                          cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(argv)} exited with {proc.returncode}:\n{proc.stderr[-2000:]}")
+    total_us, modules = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        modules.add(name)
+        if name not in skip:
+            total_us += int(self_us)
+    return total_us, modules
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--budget-ms", type=float, default=40.0, help="Max summed import time per command (default: 40)")
+    p.add_argument("--runs", type=int, default=5, help="Runs per command; the fastest one is compared (default: 5)")
+    args = p.parse_args()
+
+    _, startup = import_profile(["-c", "pass"])
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, argv in commands(tmp).items():
+            best, modules = None, set()
+            for _ in range(args.runs):
+                total_us, modules = import_profile([SCRIPT] + argv, skip=startup)
+                best = total_us if best is None else min(best, total_us)
+            ms = best / 1000.0
+            leaked = sorted(m for m in modules if m in FORBIDDEN)
+            ok = ms <= args.budget_ms and not leaked
+            failed |= not ok
+            status = "ok" if ok else "FAIL"
+            sys.stdout.write(f"{status:4}  {name:18} {ms:7.1f} ms")
+            if leaked:
+                sys.stdout.write(f"  imports {', '.join(leaked)}")
+            sys.stdout.write("\n")
+
+    sys.stdout.write(f"budget: {args.budget_ms:.1f} ms per command\n")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import contextlib, copy, fnmatch, io, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+from lib.extract import NotAGraphError
+from lib.generate import ledger_path_for
+from lib.graphing import ensure_graph
+from lib.ops import apply_graph_op, extract_file
+from lib.utils import load_graph, save_graph
+
+def list_batch_files(in_dir: str, pattern: str) -> List[str]:
+    # sorted so output, summary and worker assignment are the same on every run
+    return sorted(
+        name for name in os.listdir(in_dir)
+        if fnmatch.fnmatch(name, pattern)
+    )
+
+def process_file(in_path: str, out_path: str, args) -> Dict[str, Any]:
+    args = copy.copy(args)
+    args.in_path, args.out_path = in_path, out_path
+    if args.cmd == "generate":
+        # run_batch set args.ledger to the ledger directory; one ledger per input file
+        args.ledger = os.path.join(args.ledger, os.path.basename(ledger_path_for(out_path)))
+    result = {"file": os.path.basename(in_path), "status": "ok", "reason": "", "log": ""}
+    if not os.path.isfile(in_path):
+        result["status"] = "skipped"
+        result["reason"] = "not a regular file"
+        return result
+
+    # capture per-file output so parallel workers don't interleave on the terminal
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(buf), contextlib.redirect_stdout(buf):
+            if args.cmd == "extract" and args.stream:
+                extract_file(in_path, out_path, args)
+            elif not isinstance(obj := load_graph(in_path), dict):
+                result["status"] = "skipped"
+                result["reason"] = "not an OpenGraph document"
+            else:
+                g = ensure_graph(obj)
+                apply_graph_op(g, args)
+                save_graph(g, out_path, pretty=args.pretty)
+    except NotAGraphError:
+        result["status"] = "skipped"
+        result["reason"] = "not an OpenGraph document"
+    except SystemExit as e:
+        result["status"] = "failed"
+        msgs = [l for l in buf.getvalue().splitlines() if l.startswith("[!]")]
+        result["reason"] = msgs[-1][4:] if msgs else f"exit code {e.code}"
+    except Exception as e:
+        result["status"] = "failed"
+        result["reason"] = f"{type(e).__name__}: {e}"
+    result["log"] = buf.getvalue()
+    return result
+
+def _process_job(job) -> Dict[str, Any]:
+    return process_file(*job)
+
+def run_batch(args) -> int:
+    if args.jobs < 1:
+        sys.stderr.write("[!] --jobs must be at least 1.\n")
+        return 1
+    if not os.path.isdir(args.in_dir):
+        sys.stderr.write(f"[!] --in-dir '{args.in_dir}' is not a directory.\n")
+        return 1
+    if os.path.abspath(args.in_dir) == os.path.abspath(args.out_dir):
+        sys.stderr.write("[!] --out-dir must differ from --in-dir (inputs would be overwritten).\n")
+        return 1
+    os.makedirs(args.out_dir, exist_ok=True)
+    if args.cmd == "generate":
+        # a subdirectory, so the next batch step's --glob never picks ledgers up as graphs
+        args.ledger = args.ledger or os.path.join(args.out_dir, "ledgers")
+        os.makedirs(args.ledger, exist_ok=True)
+
+    names = list_batch_files(args.in_dir, args.glob)
+    jobs = [(os.path.join(args.in_dir, n), os.path.join(args.out_dir, n), args) for n in names]
+
+    if args.jobs == 1 or len(jobs) <= 1:
+        results = [_process_job(j) for j in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+            # map() yields in submission order, independent of completion order
+            results = list(pool.map(_process_job, jobs))
+
+    write_summary(args.cmd, results)
+    return 1 if any(r["status"] == "failed" for r in results) else 0
+
+def write_summary(cmd: str, results: List[Dict[str, Any]]) -> None:
+    for r in results:
+        for line in r["log"].splitlines():
+            sys.stderr.write(f"[{r['file']}] {line}\n")
+
+    counts = {"ok": 0, "skipped": 0, "failed": 0}
+    for r in results:
+        counts[r["status"]] += 1
+    sys.stderr.write(f"[+] Batch {cmd}: {len(results)} file(s), {counts['ok']} ok, "
+                     f"{counts['skipped']} skipped, {counts['failed']} failed.\n")
+    for status in ("skipped", "failed"):
+        for r in results:
+            if r["status"] == status:
+                sys.stderr.write(f"[!] {status}: {r['file']}: {r['reason']}\n")
@@ -5,6 +5,10 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--in", dest="in_path", help="Input OpenGraph JSON (not needed for register-icon)")
     p.add_argument("--out", dest="out_path", help="Output OpenGraph JSON (not needed for register-icon)")
     p.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
+    p.add_argument("--in-dir", dest="in_dir", help="Apply the graph operation to every matching file in this directory (instead of --in; not for merge-graphs/register-icon)")
+    p.add_argument("--out-dir", dest="out_dir", help="Directory for batch outputs; files keep their input names (instead of --out; not for merge-graphs/register-icon)")
+    p.add_argument("--glob", default="*.json", help="File pattern matched inside --in-dir (default: *.json)")
+    p.add_argument("--jobs", type=int, default=1, help="Worker processes for --in-dir batches (default: 1)")
 
     sub = p.add_subparsers(dest="cmd", required=True)
 
@@ -63,6 +67,27 @@ def build_parser() -> argparse.ArgumentParser:
     ad.add_argument('--kind', default="inherit", help="Set the kind (useful for pathfinding) of newly created child. Defaults to parent kind.")
     ad.add_argument("--creation-date", dest="creation_date", default=None, help="Override CreationDate (ISO)")
 
+    # generate (template x CSV -> many deception nodes/edges)
+    gn = sub.add_parser("generate", help="Generate deception nodes and edges from a ${var} template and a CSV of rows.")
+    gn.add_argument("--template", required=True, help="JSON template with 'nodes' and 'edges' lists using ${column} placeholders")
+    gn.add_argument("--csv", required=True, help="CSV with a header row; each row expands the template once")
+    gn.add_argument("--ledger", default=None, help="Where to write the generation ledger (default: <out>.ledger.json). With --out-dir, a directory for per-file ledgers (default: <out-dir>/ledgers)")
+    gn.add_argument("--id-suffix", default="-DECEPTION", help="Suffix appended when a generated id already exists")
+    gn.add_argument("--description", default="", help="Description for generated nodes and edges")
+    gn.add_argument("--deception-kind", default="Deception", help="Kind added first on generated nodes")
+    gn.add_argument("--creation-date", dest="creation_date", default=None, help="Override CreationDate (ISO)")
+
+    # extract (k-hop review subgraph)
+    ex = sub.add_parser("extract", help="Extract the k-hop subgraph around deception nodes for review.")
+    ex.add_argument("--hops", type=int, default=1, help="Hops to expand from the seeds, in either edge direction (default: 1)")
+    ex.add_argument("--seed-id", action="append", help="Seed node id (CI). Can be used multiple times.")
+    ex.add_argument("--seed-kind", action="append", help="Seed all nodes carrying this kind. Can be used multiple times.")
+    ex.add_argument("--seed-edge-kind", action="append", help="Seed both ends of edges of this kind. Can be used multiple times.")
+    ex.add_argument("--deception-kind", default="Deception",
+                    help="With no --seed-* options, seed nodes of this kind and both ends of HasDeception edges")
+    ex.add_argument("--edge-kind", action="append", help="Only traverse and keep edges of this kind. Can be used multiple times.")
+    ex.add_argument("--stream", action="store_true", help="Read the input in two streaming passes instead of loading it whole")
+
     # register-icon
     ri = sub.add_parser("register-icon", help="Register a custom icon type in BloodHound.")
     ri.add_argument("--url", required=True, help="BloodHound base URL, e.g., http://127.0.0.1:8080")
@@ -0,0 +1,86 @@
+import sys
+from lib.utils import load_graph, register_deception_icon, save_graph
+
+# Handlers for the dispatch table in deceptionClone.py. Keep module-level imports
+# light: everything else is imported inside the handler that needs it.
+
+def _reject_batch(args) -> None:
+    if args.in_dir or args.out_dir:
+        sys.stderr.write(f"[!] --in-dir/--out-dir only apply to graph operations, not {args.cmd}.\n")
+        sys.exit(1)
+
+def register_icon(args) -> None:
+    _reject_batch(args)
+    verify = not args.insecure
+    register_deception_icon(
+        base_url=args.url,
+        token=args.token,
+        icon_type=args.type,
+        icon_name=args.icon,
+        icon_color=args.color,
+        verify_ssl=verify
+    )
+
+def merge_graphs(args) -> None:
+    import csv
+    from lib.graphing import merge_graph_files
+    _reject_batch(args)
+    # Parse correlate pairs from flags / file
+    correlate = []
+
+    # From repeated --correlate ID1,ID2
+    if getattr(args, "correlate", None):
+        for item in args.correlate:
+            parts = [p.strip() for p in item.split(",")]
+            if len(parts) == 2:
+                correlate.append((parts[0], parts[1]))
+            else:
+                sys.stderr.write(f"[!] Ignoring malformed --correlate '{item}' (need ID1,ID2)\n")
+
+    # From --correlate-file CSV
+    if getattr(args, "correlate_file", None):
+
+        with open(args.correlate_file, "r", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                if not row or len(row) < 2:
+                    continue
+                correlate.append((row[0].strip(), row[1].strip()))
+
+    merged = merge_graph_files(args.graph1, args.graph2, correlate=correlate)
+    save_graph(merged, args.merge_out, pretty=args.pretty)
+    sys.stderr.write(f"[+] Merged graphs into {args.merge_out} "
+                     f"with source_kind='{merged.get('metadata', {}).get('source_kind')}', "
+                     f"added {len(correlate)} 'Is' correlate edges.\n")
+
+def graph_op(args) -> None:
+    if args.cmd == "extract" and args.hops < 0:
+        sys.stderr.write("[!] --hops must be 0 or more.\n")
+        sys.exit(1)
+
+    if args.in_dir or args.out_dir:
+        if not args.in_dir or not args.out_dir:
+            sys.stderr.write("[!] --in-dir and --out-dir must be used together.\n")
+            sys.exit(1)
+        from lib.batch import run_batch
+        sys.exit(run_batch(args))
+
+    if not args.in_path or not args.out_path:
+        sys.stderr.write("[!] --in and --out are required for graph operations.\n")
+        sys.exit(1)
+
+    if args.cmd == "extract" and args.stream:
+        from lib.extract import NotAGraphError
+        from lib.ops import extract_file
+        try:
+            extract_file(args.in_path, args.out_path, args)
+        except NotAGraphError as e:
+            sys.stderr.write(f"[!] {e}\n")
+            sys.exit(1)
+        return
+
+    from lib.graphing import ensure_graph
+    from lib.ops import apply_graph_op
+    g = ensure_graph(load_graph(args.in_path))
+    apply_graph_op(g, args)
+
+    save_graph(g, args.out_path, pretty=args.pretty)
@@ -0,0 +1,254 @@
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from lib.utils import norm
+
+# Items are (section, value) pairs: ("node", n), ("edge", e), ("top", (key, value))
+# for other top-level keys such as metadata, and ("graph", (key, value)) for other
+# keys inside "graph". Both the in-memory and the streaming path produce them, so the
+# two passes below don't care where the graph came from.
+Item = Tuple[str, Any]
+
+_CHUNK = 1 << 20
+_MAX_TOKEN_TAIL = 6  # longest cut-off token the decoder can report early: a "\uXXXX" escape
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+class NotAGraphError(ValueError):
+    pass
+
+class _StreamReader:
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # characters dropped from the front of buf, for file-relative errors
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.f.read(_CHUNK)
+        if not data:
+            self.eof = True
+            return False
+        # drop what has been consumed so the buffer stays around one chunk
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input.")
+
+    def at_end(self) -> bool:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return False
+            if not self._fill():
+                return True
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise ValueError(f"Expected '{ch}' at offset {self.offset + self.pos}, found '{got}'.")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                v, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Only a value cut off by the end of the buffer can be fixed by reading more;
+                # anything else is corrupt, and refilling would buffer the rest of the file.
+                if self._truncated(e) and self._fill():
+                    continue
+                raise ValueError(f"{e.msg} at offset {self.offset + e.pos}") from None
+            if self._may_continue(v, end) and self._fill():
+                continue
+            self.pos = end
+            return v
+
+    def _truncated(self, e: json.JSONDecodeError) -> bool:
+        # An unterminated string is reported at its opening quote; every other truncation
+        # (cut literal, number, escape or delimiter) is reported within a few characters of the end.
+        return e.msg.startswith("Unterminated string") or e.pos >= len(self.buf) - _MAX_TOKEN_TAIL
+
+    def _may_continue(self, v: Any, end: int) -> bool:
+        # A value that reaches the end of the buffer, or a number followed only by number
+        # characters (e.g. "1." + "5"), may carry on in the next chunk.
+        number = isinstance(v, (int, float)) and not isinstance(v, bool)
+        buf = self.buf
+        for i in range(end, len(buf)):
+            ch = buf[i]
+            if ch in " \t\r\n" or (number and ch in _NUMBER_CHARS):
+                continue
+            return False
+        return True
+
+    def members(self) -> Iterator[str]:
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+    def elements(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+def iter_graph_file(path: str) -> Iterator[Item]:
+    # Only one node or edge is decoded at a time, so the file is never held whole.
+    with open(path, "r", encoding="utf-8") as f:
+        r = _StreamReader(f)
+        if r.peek() != "{":
+            # decode first so that corrupt input fails like json.load, rather than being skipped
+            r.value()
+            if not r.at_end():
+                raise ValueError(f"Extra data after the top-level JSON value in {path}.")
+            raise NotAGraphError(f"{path} is not an OpenGraph document (top level is not a JSON object).")
+        for key in r.members():
+            if key != "graph" or r.peek() != "{":
+                yield ("top", (key, r.value()))
+                continue
+            for gkey in r.members():
+                if gkey in ("nodes", "edges") and r.peek() == "[":
+                    section = gkey[:-1]
+                    for item in r.elements():
+                        yield (section, item)
+                else:
+                    yield ("graph", (gkey, r.value()))
+        if not r.at_end():
+            raise ValueError(f"Extra data after the top-level JSON object in {path}.")
+
+def iter_graph(g: Dict[str, Any]) -> Iterator[Item]:
+    for k, v in g.items():
+        if k != "graph":
+            yield ("top", (k, v))
+    for k, v in g.get("graph", {}).items():
+        if k not in ("nodes", "edges"):
+            yield ("graph", (k, v))
+    for n in g["graph"]["nodes"]:
+        yield ("node", n)
+    for e in g["graph"]["edges"]:
+        yield ("edge", e)
+
+def _edge_ends(e: Dict[str, Any]) -> Tuple[Any, Any]:
+    return e.get("start", {}).get("value"), e.get("end", {}).get("value")
+
+def collect_neighbourhood(
+    items: Iterable[Item],
+    hops: int,
+    seed_ids: Optional[List[str]] = None,
+    seed_kinds: Optional[List[str]] = None,
+    seed_edge_kinds: Optional[List[str]] = None,
+    edge_kinds: Optional[List[str]] = None,
+) -> Set[str]:
+    # Pass 1: find seeds and build a bidirectional adjacency index of ids only.
+    want_ids = {norm(x) for x in seed_ids or []}
+    want_kinds = {norm(k) for k in seed_kinds or []}
+    want_seed_edges = {norm(k) for k in seed_edge_kinds or []}
+    allowed = {norm(k) for k in edge_kinds} if edge_kinds else None
+
+    seeds: Set[str] = set()
+    adj: Dict[str, Set[str]] = {}
+    for section, obj in items:
+        if section == "node":
+            nid = obj.get("id")
+            if norm(nid) in want_ids or any(norm(k) in want_kinds for k in obj.get("kinds") or []):
+                seeds.add(nid)
+        elif section == "edge":
+            kind = norm(obj.get("kind"))
+            s, t = _edge_ends(obj)
+            if kind in want_seed_edges:
+                seeds.update((s, t))
+            if allowed is not None and kind not in allowed:
+                continue
+            adj.setdefault(s, set()).add(t)
+            adj.setdefault(t, set()).add(s)
+
+    keep = set(seeds)
+    frontier = seeds
+    for _ in range(hops):
+        nxt = set()
+        for nid in frontier:
+            nxt.update(adj.get(nid, ()))
+        frontier = nxt - keep
+        if not frontier:
+            break
+        keep |= frontier
+    return keep
+
+def induced_subgraph(items: Iterable[Item], keep: Set[str],
+                     edge_kinds: Optional[List[str]] = None) -> Dict[str, Any]:
+    # Pass 2: keep only nodes in the neighbourhood and edges with both ends in it.
+    allowed = {norm(k) for k in edge_kinds} if edge_kinds else None
+    out: Dict[str, Any] = {}
+    graph: Dict[str, Any] = {}
+    nodes, edges = [], []
+    for section, obj in items:
+        if section == "top":
+            out[obj[0]] = obj[1]
+        elif section == "graph":
+            graph[obj[0]] = obj[1]
+        elif section == "node":
+            if obj.get("id") in keep:
+                nodes.append(obj)
+        elif section == "edge":
+            if allowed is not None and norm(obj.get("kind")) not in allowed:
+                continue
+            s, t = _edge_ends(obj)
+            if s in keep and t in keep:
+                edges.append(obj)
+    graph["nodes"] = nodes
+    graph["edges"] = edges
+    out["graph"] = graph
+    return out
+
+def extract_subgraph(items_factory: Callable[[], Iterable[Item]], hops: int,
+                     seed_ids: Optional[List[str]] = None,
+                     seed_kinds: Optional[List[str]] = None,
+                     seed_edge_kinds: Optional[List[str]] = None,
+                     edge_kinds: Optional[List[str]] = None) -> Dict[str, Any]:
+    keep = collect_neighbourhood(items_factory(), hops, seed_ids=seed_ids, seed_kinds=seed_kinds,
+                                 seed_edge_kinds=seed_edge_kinds, edge_kinds=edge_kinds)
+    return induced_subgraph(items_factory(), keep, edge_kinds=edge_kinds)
+
+def extract_selectors(args) -> Dict[str, Any]:
+    seed_ids = args.seed_id or []
+    seed_kinds = args.seed_kind or []
+    seed_edge_kinds = args.seed_edge_kind or []
+    if not (seed_ids or seed_kinds or seed_edge_kinds):
+        seed_kinds = [args.deception_kind]
+        seed_edge_kinds = ["HasDeception"]
+    return {
+        "seed_ids": seed_ids,
+        "seed_kinds": seed_kinds,
+        "seed_edge_kinds": seed_edge_kinds,
+        "edge_kinds": args.edge_kind,
+    }
@@ -0,0 +1,156 @@
+import csv, json
+from typing import Any, Dict, List, Optional
+from lib.graphing import annotate_edge_props, annotate_node_props
+from lib.utils import compile_vars, expand_vars, norm, now_iso, template_vars
+
+# Template layout (JSON):
+# {
+#   "nodes": [{"ref": "user", "id": "honey-${login}", "kinds": ["GHUser"], "properties": {"name": "${login}"}}],
+#   "edges": [{"kind": "MemberOf", "start": "@user", "end": "${org_id}", "properties": {}}]
+# }
+# Edge endpoints starting with "@" refer to a node generated from the same row;
+# anything else is matched (case-insensitively, like --id) against node ids in the graph.
+
+def load_template(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        tpl = json.load(f)
+    if not isinstance(tpl, dict) or not isinstance(tpl.get("nodes"), list) or not tpl["nodes"]:
+        raise ValueError(f"Template {path} must be an object with a non-empty 'nodes' list.")
+    if not isinstance(tpl.get("edges", []), list):
+        raise ValueError(f"Template {path} 'edges' must be a list.")
+
+    refs = set()
+    for i, nt in enumerate(tpl["nodes"]):
+        if not isinstance(nt, dict):
+            raise ValueError(f"Template node #{i} must be an object.")
+        if "id" not in nt:
+            raise ValueError(f"Template node #{i} has no 'id'.")
+        if not isinstance(nt["id"], str):
+            raise ValueError(f"Template node #{i} 'id' must be a string.")
+        if not isinstance(nt.get("kinds", []), list):
+            raise ValueError(f"Template node #{i} 'kinds' must be a list.")
+        if not isinstance(nt.get("properties", {}), dict):
+            raise ValueError(f"Template node #{i} 'properties' must be an object.")
+        nt.setdefault("ref", f"node{i}")
+        if not isinstance(nt["ref"], str):
+            raise ValueError(f"Template node #{i} 'ref' must be a string.")
+        if nt["ref"] in refs:
+            raise ValueError(f"Template node ref '{nt['ref']}' is used more than once.")
+        refs.add(nt["ref"])
+    for i, et in enumerate(tpl.get("edges", [])):
+        if not isinstance(et, dict):
+            raise ValueError(f"Template edge #{i} must be an object.")
+        for key in ("kind", "start", "end"):
+            if key not in et:
+                raise ValueError(f"Template edge #{i} has no '{key}'.")
+            if not isinstance(et[key], str):
+                raise ValueError(f"Template edge #{i} '{key}' must be a string.")
+        if not isinstance(et.get("properties", {}), dict):
+            raise ValueError(f"Template edge #{i} 'properties' must be an object.")
+        for key in ("start", "end"):
+            v = et[key]
+            if v.startswith("@") and v[1:] not in refs:
+                raise ValueError(f"Template edge #{i} {key} '{v}' does not name a template node ref.")
+
+    return {"nodes": compile_vars(tpl["nodes"]), "edges": compile_vars(tpl.get("edges", []))}
+
+def allocate_id(id_index: Dict[str, Any], base_id: str, suffix: str) -> str:
+    # like unique_node_id, but case-insensitive so a decoy can never shadow a real node
+    if norm(base_id) not in id_index:
+        return base_id
+    candidate = f"{base_id}{suffix}"
+    i = 1
+    while norm(candidate) in id_index:
+        i += 1
+        candidate = f"{base_id}{suffix}-{i}"
+    return candidate
+
+def read_rows(path: str) -> List[Dict[str, str]]:
+    # utf-8-sig strips the BOM Excel puts in front of the first header
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+def generate_from_template(
+    graph: Dict[str, Any],
+    template: Dict[str, Any],
+    rows: List[Dict[str, str]],
+    id_suffix: str,
+    description: str,
+    deception_kind: str,
+    creation_date: Optional[str],
+) -> Dict[str, Any]:
+    nodes = graph["graph"]["nodes"]
+    edges = graph["graph"]["edges"]
+
+    if rows:
+        missing = template_vars(template) - set(rows[0].keys())
+        if missing:
+            raise ValueError(f"CSV has no column(s) for template variable(s): {sorted(missing)}")
+    # reject ragged rows before the graph is touched; DictReader fills short rows
+    # with None and collects surplus fields under the None key
+    for row_no, row in enumerate(rows, start=2):
+        if None in row.values():
+            raise ValueError(f"CSV row {row_no} has fewer fields than the header.")
+        if None in row:
+            raise ValueError(f"CSV row {row_no} has more fields than the header.")
+
+    # built once for the whole run; every allocation below adds to it. Keyed by
+    # norm() so collisions are detected the same way --id and endpoints match.
+    id_index: Dict[str, Any] = {}
+    for n in nodes:
+        id_index.setdefault(norm(n.get("id")), n.get("id"))
+    stamp = creation_date or now_iso()
+
+    ledger = {"rows": len(rows), "nodes": [], "edges": [], "unresolved": []}
+
+    for row_no, row in enumerate(rows, start=2):  # row 1 is the CSV header
+        row_ids = {}
+        for nt in template["nodes"]:
+            n = expand_vars(nt, row)
+            ref = n.pop("ref")
+            base_id = n["id"]
+            new_id = allocate_id(id_index, base_id, id_suffix)
+            n["id"] = new_id
+
+            kinds = [k for k in n.get("kinds", []) if k != deception_kind]
+            n["kinds"] = ([deception_kind] + kinds)[:2] if deception_kind else kinds[:2]
+            props = n.setdefault("properties", {})
+            annotate_node_props(props, description=description, creation_date=stamp)
+            props["objectid"] = new_id
+
+            nodes.append(n)
+            id_index.setdefault(norm(new_id), new_id)
+            row_ids[ref] = new_id
+            ledger["nodes"].append({"row": row_no, "ref": ref, "id": new_id})
+
+        for et in template["edges"]:
+            e = expand_vars(et, row)
+            ends = {}
+            for key in ("start", "end"):
+                v = e[key]
+                ends[key] = row_ids[v[1:]] if v.startswith("@") else id_index.get(norm(v))
+                if ends[key] is None:
+                    ledger["unresolved"].append({"row": row_no, "kind": e["kind"], key: v})
+            if ends["start"] is None or ends["end"] is None:
+                continue
+
+            props = dict(e.get("properties", {}))
+            annotate_edge_props(props, description=description,
+                                source_id=f"{e['kind']}:{ends['start']}->{ends['end']}", creation_date=stamp)
+            edges.append({
+                "kind": e["kind"],
+                "start": {"value": ends["start"], "match_by": "id"},
+                "end": {"value": ends["end"], "match_by": "id"},
+                "properties": props,
+            })
+            ledger["edges"].append({"row": row_no, "kind": e["kind"], "start": ends["start"], "end": ends["end"]})
+
+    return ledger
+
+def save_ledger(ledger: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(ledger, f, indent=2, ensure_ascii=False)
+
+def ledger_path_for(out_path: str) -> str:
+    base = out_path[:-5] if out_path.lower().endswith(".json") else out_path
+    return f"{base}.ledger.json"
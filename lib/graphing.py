@@ -1,6 +1,6 @@
 import copy, sys
 from typing import Any, Dict, List, Optional
-from utils import load_graph
+from lib.utils import *
 
 def ensure_graph(obj: Dict[str, Any]) -> Dict[str, Any]:
     obj.setdefault("graph", {})
@@ -0,0 +1,140 @@
+import sys
+from typing import Any, Dict
+from lib.graphing import *
+from lib.utils import *
+
+def apply_graph_op(g: Dict[str, Any], args) -> None:
+    nodes = g["graph"]["nodes"]
+    edges = g["graph"]["edges"]
+
+    warn_duplicate_node_ids(nodes)
+
+    if args.cmd == "clone-node":
+        match = find_nodes(nodes, node_id=getattr(args, "node_id", None))
+        if not match:
+            sys.stderr.write("[!] No node matched the provided node_id.\n")
+            sys.exit(1)
+
+        target = match
+        new_node = clone_node(
+            graph=g,
+            target=target,
+            id_suffix=args.id_suffix,
+            name=args.name,
+            name_suffix=args.name_suffix,
+            mirror_edges=args.mirror_edges,
+            skip_duplicates=args.skip_duplicates,
+            annotate=args.annotate,
+            description=args.description,
+            deception_kind=args.deception_kind,
+            creation_date=args.creation_date,
+        )
+        sys.stderr.write(f"[+] Cloned node {target['id']} -> {new_node['id']}\n")
+
+    elif args.cmd == "clone-edge":
+        src = find_edge(edges, args.edge_kind, args.start, args.end)
+        if not src:
+            sys.stderr.write("[!] Edge not found with provided kind/start/end.\n")
+            sys.exit(1)
+        new_e = clone_edge(
+            graph=g,
+            edge=src,
+            skip_duplicates=args.skip_duplicates,
+            annotate=args.annotate,
+            description=args.description,
+            creation_date=args.creation_date,
+        )
+        sys.stderr.write(f"[+] Cloned edge {src['kind']} {src['start']['value']} -> {src['end']['value']}\n")
+
+    elif args.cmd == "decept-node":
+        match = find_nodes(nodes, node_id=getattr(args, "node_id", None))
+        if not match:
+            sys.stderr.write("[!] No node matched the provided node_id.\n")
+            sys.exit(1)
+
+        target = match
+        decept_node(
+            node=target,
+            name=args.name,
+            name_suffix=args.name_suffix,
+            description=args.description,
+            creation_date=args.creation_date,
+            deception_kind=args.deception_kind,
+        )
+        sys.stderr.write(f"[+] Marked node {target['id']} as deception (in place).\n")
+
+    elif args.cmd == "decept-edge":
+        src = find_edge(edges, args.edge_kind, args.start, args.end)
+        if not src:
+            sys.stderr.write("[!] Edge not found with provided kind/start/end.\n")
+            sys.exit(1)
+        decept_edge(
+            edge=src,
+            description=args.description,
+            creation_date=args.creation_date,
+        )
+        sys.stderr.write(f"[+] Marked edge {src['kind']} {src['start']['value']} -> {src['end']['value']} as deception (in place).\n")
+
+    elif args.cmd == "attach-deception":
+        match = find_nodes(nodes, node_id=getattr(args, "node_id", None))
+        if not match:
+            sys.stderr.write("[!] No parent node matched the provided node_id.\n")
+            sys.exit(1)
+
+        parent = match
+        child = attach_deception_child(
+            graph=g,
+            parent=parent,
+            child_name=args.name,
+            description=args.description,
+            id_suffix=args.id_suffix,
+            deception_kind=args.deception_kind,
+            type=args.type,
+            kind=args.kind,
+            creation_date=args.creation_date,
+        )
+        sys.stderr.write(f"[+] Attached deception child {child['id']} to parent {parent['id']} via HasDeception.\n")
+
+    elif args.cmd == "generate":
+        from lib.generate import generate_from_template, ledger_path_for, load_template, read_rows, save_ledger
+        try:
+            template = load_template(args.template)
+            rows = read_rows(args.csv)
+            ledger = generate_from_template(
+                graph=g,
+                template=template,
+                rows=rows,
+                id_suffix=args.id_suffix,
+                description=args.description,
+                deception_kind=args.deception_kind,
+                creation_date=args.creation_date,
+            )
+        except ValueError as e:
+            sys.stderr.write(f"[!] {e}\n")
+            sys.exit(1)
+        ledger_path = args.ledger or ledger_path_for(args.out_path)
+        save_ledger(ledger, ledger_path)
+        sys.stderr.write(f"[+] Generated {len(ledger['nodes'])} nodes and {len(ledger['edges'])} edges "
+                         f"from {ledger['rows']} rows; ledger written to {ledger_path}.\n")
+        if ledger["unresolved"]:
+            sys.stderr.write(f"[!] {len(ledger['unresolved'])} edge endpoint(s) did not match any node; see ledger.\n")
+
+    elif args.cmd == "extract":
+        from lib.extract import extract_selectors, extract_subgraph, iter_graph
+        sub = extract_subgraph(lambda: iter_graph(g), args.hops, **extract_selectors(args))
+        g.clear()
+        g.update(sub)
+        sys.stderr.write(f"[+] Extracted {len(g['graph']['nodes'])} nodes and {len(g['graph']['edges'])} edges "
+                         f"within {args.hops} hop(s) of the seeds.\n")
+        if not g["graph"]["nodes"]:
+            sys.stderr.write("[!] Warning: no nodes matched the seed selectors; the extracted graph is empty.\n")
+
+def extract_file(in_path: str, out_path: str, args) -> None:
+    # --stream: two passes over the file, never holding the whole input graph
+    from lib.extract import extract_selectors, extract_subgraph, iter_graph_file
+    sub = extract_subgraph(lambda: iter_graph_file(in_path), args.hops, **extract_selectors(args))
+    save_graph(sub, out_path, pretty=args.pretty)
+    sys.stderr.write(f"[+] Extracted {len(sub['graph']['nodes'])} nodes and {len(sub['graph']['edges'])} edges "
+                     f"within {args.hops} hop(s) of the seeds (streamed).\n")
+    if not sub["graph"]["nodes"]:
+        sys.stderr.write("[!] Warning: no nodes matched the seed selectors; the extracted graph is empty.\n")
@@ -1,5 +1,5 @@
 from typing import Any, Dict, List, Optional
-import json, requests, datetime, re
+import json, datetime, re, sys
 
 def load_graph(path: str) -> Dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
@@ -54,6 +54,43 @@ def _sub_vars(text: str, vars_map: Dict[str, str]) -> str:
         return vars_map.get(key, m.group(0))
     return re.sub(r"\$\{([A-Za-z0-9_]+)\}", repl, text)
 
+_VAR_RE = re.compile(r"\$\{([A-Za-z0-9_]+)\}")
+
+def compile_vars(obj: Any) -> Any:
+    # Precompile a template once: strings become ("parts", [...]) where odd
+    # entries are variable names, so expanding a row is a join, not a regex scan.
+    if isinstance(obj, str):
+        parts = _VAR_RE.split(obj)
+        return obj if len(parts) == 1 else ("parts", parts)
+    if isinstance(obj, dict):
+        return {k: compile_vars(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [compile_vars(v) for v in obj]
+    return obj
+
+def template_vars(compiled: Any) -> set:
+    if isinstance(compiled, tuple) and compiled and compiled[0] == "parts":
+        return set(compiled[1][1::2])
+    if isinstance(compiled, dict):
+        return set().union(*(template_vars(v) for v in compiled.values()))
+    if isinstance(compiled, list):
+        return set().union(*(template_vars(v) for v in compiled))
+    return set()
+
+def expand_vars(compiled: Any, vars_map: Dict[str, str]) -> Any:
+    # Same semantics as _sub_vars: unknown variables are left as ${name}.
+    if isinstance(compiled, tuple) and compiled and compiled[0] == "parts":
+        parts = compiled[1]
+        out = []
+        for i, p in enumerate(parts):
+            out.append(p if i % 2 == 0 else vars_map.get(p, "${" + p + "}"))
+        return "".join(out)
+    if isinstance(compiled, dict):
+        return {k: expand_vars(v, vars_map) for k, v in compiled.items()}
+    if isinstance(compiled, list):
+        return [expand_vars(v, vars_map) for v in compiled]
+    return compiled
+
 
 def register_deception_icon(
     base_url: str,
@@ -63,6 +100,11 @@ def register_deception_icon(
     icon_color: str = "#FFD60A",
     verify_ssl: bool = True,
 ) -> None:
+    # imported here so that commands which never touch the network don't pay for requests/urllib3
+    try:
+        import requests
+    except ImportError:
+        requests = None
     if requests is None:
         raise RuntimeError("The 'requests' package is required for register-icon (pip install requests).")
     url = f"{base_url.rstrip('/')}/api/v2/custom-nodes"